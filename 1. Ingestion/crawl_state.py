@@ -0,0 +1,192 @@
+import json
+import sqlite3
+import time
+from typing import Dict, List, Optional, Tuple
+
+# ---------------- CONFIG ---------------- #
+
+LEASE_SECONDS = 300      # a claim older than this is assumed abandoned
+MAX_ATTEMPTS = 3
+RETRY_DELAY = 30         # seconds before a failed item is retried, times attempts
+CHECKPOINT_EVERY = 10    # completed items per commit
+
+PENDING = "pending"
+IN_PROGRESS = "in_progress"
+DONE = "done"
+FAILED = "failed"
+
+# ---------------- SCHEMA ---------------- #
+
+def open_state(path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript("""
+    CREATE TABLE IF NOT EXISTS frontier (
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        url TEXT NOT NULL UNIQUE,
+        kind TEXT NOT NULL,
+        faculty_type TEXT,
+        source_listing_url TEXT,
+        status TEXT NOT NULL DEFAULT 'pending',
+        attempts INTEGER NOT NULL DEFAULT 0,
+        worker TEXT,
+        claimed_at REAL,
+        not_before REAL
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_frontier_status ON frontier (status, seq);
+
+    CREATE TABLE IF NOT EXISTS records (
+        url TEXT PRIMARY KEY,
+        record TEXT NOT NULL
+    );
+    """)
+
+    # state files written before retry delays existed
+    columns = {r["name"] for r in conn.execute("PRAGMA table_info(frontier)")}
+    if "not_before" not in columns:
+        conn.execute("ALTER TABLE frontier ADD COLUMN not_before REAL")
+    return conn
+
+# ---------------- FRONTIER ---------------- #
+
+def enqueue(conn: sqlite3.Connection, items: List[Tuple[str, str, str, Optional[str]]]):
+    """
+    Add (url, kind, faculty_type, source_listing_url) items to the frontier.
+    A URL already present (in any state) is ignored, so the frontier
+    doubles as the persistent visited set.
+    """
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        conn.executemany(
+            """INSERT OR IGNORE INTO frontier (url, kind, faculty_type, source_listing_url)
+            VALUES (?, ?, ?, ?)""",
+            items
+        )
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+
+def release_stale_claims(conn: sqlite3.Connection, lease_seconds: float = LEASE_SECONDS):
+    """Return claims left behind by a dead worker to the frontier."""
+    conn.execute(
+        "UPDATE frontier SET status=?, worker=NULL, claimed_at=NULL WHERE status=? AND claimed_at < ?",
+        (PENDING, IN_PROGRESS, time.time() - lease_seconds)
+    )
+
+
+def release_worker_claims(conn: sqlite3.Connection, worker: str):
+    """Return everything a worker known to be dead had claimed."""
+    conn.execute(
+        "UPDATE frontier SET status=?, worker=NULL, claimed_at=NULL WHERE status=? AND worker=?",
+        (PENDING, IN_PROGRESS, worker)
+    )
+
+
+def requeue_failed(conn: sqlite3.Connection):
+    """Give items that ran out of attempts in an earlier run a fresh start."""
+    conn.execute(
+        "UPDATE frontier SET status=?, attempts=0, not_before=NULL WHERE status=?",
+        (PENDING, FAILED)
+    )
+
+
+def claim_next(conn: sqlite3.Connection, worker: str) -> Optional[sqlite3.Row]:
+    """
+    Atomically take the next pending item whose retry delay has passed.
+    Listings are served before profiles so the frontier fills up as early
+    as possible.
+    """
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        row = conn.execute(
+            """SELECT * FROM frontier
+            WHERE status=? AND (not_before IS NULL OR not_before <= ?)
+            ORDER BY kind != 'listing', seq LIMIT 1""",
+            (PENDING, time.time())
+        ).fetchone()
+        if row:
+            conn.execute(
+                "UPDATE frontier SET status=?, worker=?, claimed_at=?, attempts=attempts+1 WHERE seq=?",
+                (IN_PROGRESS, worker, time.time(), row["seq"])
+            )
+        conn.execute("COMMIT")
+        return row
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+
+def has_outstanding(conn: sqlite3.Connection) -> bool:
+    row = conn.execute(
+        "SELECT 1 FROM frontier WHERE status IN (?, ?) LIMIT 1",
+        (PENDING, IN_PROGRESS)
+    ).fetchone()
+    return row is not None
+
+
+def failed_count(conn: sqlite3.Connection, kind: str) -> int:
+    return conn.execute(
+        "SELECT COUNT(*) FROM frontier WHERE status=? AND kind=?",
+        (FAILED, kind)
+    ).fetchone()[0]
+
+# ---------------- CHECKPOINT ---------------- #
+
+def checkpoint(
+    conn: sqlite3.Connection,
+    done: List[Tuple[str, Optional[Dict]]],
+    failed: List[str]
+):
+    """
+    Persist a batch of finished items in one transaction. Completed
+    records are stored alongside their frontier entry; failed items go
+    back to the frontier after a growing delay until MAX_ATTEMPTS is
+    reached.
+    """
+    if not done and not failed:
+        return
+
+    now = time.time()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        for url, record in done:
+            if record is not None:
+                conn.execute(
+                    "INSERT OR REPLACE INTO records (url, record) VALUES (?, ?)",
+                    (url, json.dumps(record, ensure_ascii=False))
+                )
+            conn.execute(
+                "UPDATE frontier SET status=?, worker=NULL, claimed_at=NULL WHERE url=?",
+                (DONE, url)
+            )
+
+        for url in failed:
+            conn.execute(
+                """UPDATE frontier
+                SET status = CASE WHEN attempts >= ? THEN ? ELSE ? END,
+                    not_before = ? + ? * attempts,
+                    worker=NULL, claimed_at=NULL
+                WHERE url=?""",
+                (MAX_ATTEMPTS, FAILED, PENDING, now, RETRY_DELAY, url)
+            )
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+    done.clear()
+    failed.clear()
+
+
+def completed_records(conn: sqlite3.Connection) -> List[Dict]:
+    rows = conn.execute(
+        """SELECT r.record FROM records r
+        JOIN frontier f ON f.url = r.url
+        ORDER BY f.seq"""
+    ).fetchall()
+    return [json.loads(r["record"]) for r in rows]
@@ -1,10 +1,31 @@
+import argparse
 import requests
-import json
 import logging
+import multiprocessing
 import os
+import sys
+import time
 from bs4 import BeautifulSoup, NavigableString
 from datetime import datetime
-from typing import List, Dict, Set, Optional
+from typing import List, Dict, Optional, Tuple
+
+# records.py sits at the project root and is shared by every stage
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from records import RawRecord, dump_records
+
+from crawl_state import (
+    CHECKPOINT_EVERY,
+    checkpoint,
+    claim_next,
+    completed_records,
+    enqueue,
+    failed_count,
+    has_outstanding,
+    open_state,
+    release_stale_claims,
+    release_worker_claims,
+    requeue_failed,
+)
 
 # ---------------- CONFIG ---------------- #
 
@@ -12,8 +33,10 @@ PROJECT_ROOT = os.path.abspath(
     os.path.join(os.path.dirname(__file__), "..")
 )
 
-OUTPUT_FILE = os.path.join(PROJECT_ROOT, "faculty_profiles.json")
+OUTPUT_FILE = os.path.join(PROJECT_ROOT, "faculty_profiles.ndjson")
+STATE_FILE = os.path.join(PROJECT_ROOT, "crawl_state.db")
 TIMEOUT = 20
+IDLE_WAIT = 1.0
 
 LISTING_PAGES = [
     ("https://www.daiict.ac.in/faculty", "core"),
@@ -151,66 +174,163 @@ def parse_profile_page(
 # ---------------- VALIDATION ---------------- #
 
 def validate_record(record: Dict) -> bool:
-    required_keys = [
-        "name", "faculty_type", "education", "phone", "email", "address",
-        "specialization", "profile_url", "biography", "publications",
-        "teaching", "source_listing_url", "scraped_at"
-    ]
-    for key in required_keys:
-        if key not in record:
-            return False
-    return True
+    return RawRecord.is_valid(record)
 
 # ---------------- OUTPUT ---------------- #
 
 def write_output(records: List[Dict], filename: str):
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(records, f, ensure_ascii=False, indent=2)
+    dump_records((RawRecord.from_dict(r) for r in records), filename)
     logging.info(f"Wrote {len(records)} records to {filename}")
 
-# ---------------- MAIN DRIVER ---------------- #
-
-def main():
-    visited_profiles: Set[str] = set()
-    final_records: List[Dict] = []
+# ---------------- CRAWL WORKER ---------------- #
 
-    for listing_url, faculty_type in LISTING_PAGES:
-        logging.info(f"Scraping listing: {listing_url}")
-        html = fetch_html(listing_url)
-        if not html:
-            logging.error("Listing page failed — exiting cleanly.")
-            return
+def crawl_worker(worker_id: str, state_path: str):
+    """
+    Pull items from the shared frontier until it is drained. Several
+    workers (processes) can run against the same state file.
+    """
+    conn = open_state(state_path)
+    done: List[Tuple[str, Optional[Dict]]] = []
+    failed: List[str] = []
 
-        listing_records = parse_listing_page(html, listing_url, faculty_type)
-
-        for entry in listing_records:
-            profile_url = entry["profile_url"]
-            if profile_url in visited_profiles:
+    try:
+        while True:
+            item = claim_next(conn, worker_id)
+            if item is None:
+                checkpoint(conn, done, failed)
+                if not has_outstanding(conn):
+                    break
+                # Other workers still hold claims that may add profiles
+                release_stale_claims(conn)
+                time.sleep(IDLE_WAIT)
                 continue
 
-            visited_profiles.add(profile_url)
-            logging.info(f"Scraping profile: {profile_url}")
+            url = item["url"]
+
+            if item["kind"] == "listing":
+                logging.info(f"Scraping listing: {url}")
+                html = fetch_html(url)
+                if not html:
+                    logging.error(f"Listing page failed: {url}")
+                    failed.append(url)
+                    checkpoint(conn, done, failed)
+                    continue
+
+                listing_records = parse_listing_page(html, url, item["faculty_type"])
+                enqueue(conn, [
+                    (entry["profile_url"], "profile", entry["faculty_type"], entry["source_listing_url"])
+                    for entry in listing_records
+                ])
+                done.append((url, None))
+                checkpoint(conn, done, failed)
+                continue
 
-            profile_html = fetch_html(profile_url)
+            logging.info(f"[{worker_id}] Scraping profile: {url}")
+            profile_html = fetch_html(url)
             if not profile_html:
-                logging.error(f"Skipping failed profile: {profile_url}")
-                continue
+                logging.error(f"Failed profile, will retry: {url}")
+                failed.append(url)
+            else:
+                record = parse_profile_page(
+                    profile_html,
+                    url,
+                    item["faculty_type"],
+                    item["source_listing_url"]
+                )
+
+                if record and validate_record(record):
+                    done.append((url, record))
+                else:
+                    logging.error(f"Invalid record skipped: {url}")
+                    done.append((url, None))
+
+            if len(done) + len(failed) >= CHECKPOINT_EVERY:
+                checkpoint(conn, done, failed)
+    finally:
+        checkpoint(conn, done, failed)
+        conn.close()
+
+# ---------------- MAIN DRIVER ---------------- #
 
-            record = parse_profile_page(
-                profile_html,
-                profile_url,
-                entry["faculty_type"],
-                entry["source_listing_url"]
-            )
+def run_workers(workers: int):
+    """
+    Run crawl processes and watch them. When one dies, its claims go back
+    to the frontier at once so the survivors can take them over instead
+    of waiting for the lease to expire.
+    """
+    procs = {
+        f"worker-{n}": multiprocessing.Process(target=crawl_worker, args=(f"worker-{n}", STATE_FILE))
+        for n in range(workers)
+    }
+    for p in procs.values():
+        p.start()
+
+    running = dict(procs)
+    while running:
+        for worker_id, p in list(running.items()):
+            p.join(timeout=IDLE_WAIT / len(running))
+            if p.is_alive():
+                continue
 
-            if record and validate_record(record):
-                final_records.append(record)
-            else:
-                logging.error(f"Invalid record skipped: {profile_url}")
+            del running[worker_id]
+            if p.exitcode != 0:
+                logging.error(f"{worker_id} died (exit code {p.exitcode}) — releasing its claims")
+                conn = open_state(STATE_FILE)
+                release_worker_claims(conn, worker_id)
+                conn.close()
+
+
+def main(workers: int = 1, fresh: bool = False) -> int:
+    if fresh and os.path.exists(STATE_FILE):
+        os.remove(STATE_FILE)
+
+    conn = open_state(STATE_FILE)
+    # Seeding is idempotent: listings already in the frontier are kept as-is
+    enqueue(conn, [
+        (listing_url, "listing", faculty_type, None)
+        for listing_url, faculty_type in LISTING_PAGES
+    ])
+    # No worker is alive yet, so every open claim belongs to a dead run
+    release_stale_claims(conn, lease_seconds=0)
+    requeue_failed(conn)
+    conn.close()
+
+    if workers > 1:
+        run_workers(workers)
+    else:
+        crawl_worker("worker-0", STATE_FILE)
+
+    conn = open_state(STATE_FILE)
+    incomplete = has_outstanding(conn)
+    failed_listings = failed_count(conn, "listing")
+    failed_profiles = failed_count(conn, "profile")
+    final_records = completed_records(conn)
+    conn.close()
+
+    if incomplete:
+        logging.error(f"Crawl interrupted — state kept in {STATE_FILE}, rerun to resume.")
+        return 1
+
+    if failed_listings:
+        # a missing listing drops a whole faculty category; never write that out
+        logging.error(
+            f"{failed_listings} listing page(s) failed after retries — "
+            f"state kept in {STATE_FILE}, rerun to resume."
+        )
+        return 1
+
+    if failed_profiles:
+        logging.error(f"{failed_profiles} profile(s) failed after retries and were skipped")
 
     write_output(final_records, OUTPUT_FILE)
+    os.remove(STATE_FILE)
+    return 0
 
 # ---------------- ENTRY POINT ---------------- #
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Crawl DA-IICT faculty profiles")
+    parser.add_argument("--workers", type=int, default=1, help="parallel crawl processes")
+    parser.add_argument("--fresh", action="store_true", help="discard saved crawl state")
+    args = parser.parse_args()
+    sys.exit(main(workers=args.workers, fresh=args.fresh))
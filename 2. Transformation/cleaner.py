@@ -1,7 +1,11 @@
-import json
 import os
 import re
-from typing import Any, Dict, List
+import sys
+from typing import Any, List
+
+# records.py sits at the project root and is shared by every stage
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from records import NA_STRING, Contact, FacultyRecord, RawRecord, dump_records, load_records
 
 # -------------------------------------------------------------------
 # Path handling (OS-safe, project-relative)
@@ -10,14 +14,9 @@ PROJECT_ROOT = os.path.abspath(
     os.path.join(os.path.dirname(__file__), "..")
 )
 
-INPUT_PATH = os.path.join(PROJECT_ROOT, "faculty_profiles.json")
+INPUT_PATH = os.path.join(PROJECT_ROOT, "faculty_profiles.ndjson")
 OUTPUT_PATH = os.path.join(PROJECT_ROOT, "faculty_cleaned.json")
 
-# -------------------------------------------------------------------
-# Constants
-# -------------------------------------------------------------------
-NA_STRING = "Not Available"
-
 # -------------------------------------------------------------------
 # Utility cleaning functions
 # -------------------------------------------------------------------
@@ -55,7 +54,7 @@ def clean_address(address: Any) -> str:
 
 
 def clean_list(values: Any) -> List[str]:
-    if not isinstance(values, list):
+    if not isinstance(values, (list, tuple)):
         return []
 
     cleaned_items = []
@@ -93,39 +92,39 @@ def separate_education_and_biography(education: str, biography: str) -> tuple[st
 # -------------------------------------------------------------------
 # Record transformation
 # -------------------------------------------------------------------
-def transform_record(record: Dict[str, Any]) -> Dict[str, Any]:
-    name = clean_string(record.get("name"))
-    faculty_type = clean_string(record.get("faculty_type"))
-    education_raw = clean_string(record.get("education"))
-    biography_raw = clean_string(record.get("biography"))
-    specialization = clean_string(record.get("specialization"))
-    profile_url = clean_string(record.get("profile_url"))
+def transform_record(record: RawRecord) -> FacultyRecord:
+    name = clean_string(record.name)
+    faculty_type = clean_string(record.faculty_type)
+    education_raw = clean_string(record.education)
+    biography_raw = clean_string(record.biography)
+    specialization = clean_string(record.specialization)
+    profile_url = clean_string(record.profile_url)
 
     education, biography = separate_education_and_biography(
         education_raw,
         biography_raw
     )
 
-    teaching = clean_list(record.get("teaching"))
-    publications = clean_list(record.get("publications"))
+    teaching = clean_list(record.teaching)
+    publications = clean_list(record.publications)
 
-    contact = {
-        "phone": clean_string(record.get("phone")),
-        "email": clean_string(record.get("email")),
-        "address": clean_address(record.get("address"))
-    }
+    contact = Contact(
+        phone=clean_string(record.phone),
+        email=clean_string(record.email),
+        address=clean_address(record.address)
+    )
 
-    return {
-        "name": name,
-        "faculty":faculty_type,
-        "education": education,
-        "biography": biography,
-        "specialization": specialization,
-        "teaching": teaching,
-        "publications": publications,
-        "contact": contact,
-        "profile_url": profile_url
-    }
+    return FacultyRecord(
+        name=name,
+        faculty_type=faculty_type,
+        education=education,
+        biography=biography,
+        specialization=specialization,
+        teaching=teaching,
+        publications=publications,
+        contact=contact,
+        profile_url=profile_url
+    )
 
 
 # -------------------------------------------------------------------
@@ -135,8 +134,7 @@ def main():
     if not os.path.exists(INPUT_PATH):
         raise FileNotFoundError(f"Input file not found: {INPUT_PATH}")
 
-    with open(INPUT_PATH, "r", encoding="utf-8") as f:
-        raw_records = json.load(f)
+    raw_records = load_records(INPUT_PATH, RawRecord)
 
     cleaned_records = []
     for record in raw_records:
@@ -146,8 +144,7 @@ def main():
             # Skip only the broken record, never crash the pipeline
             continue
 
-    with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
-        json.dump(cleaned_records, f, indent=2, ensure_ascii=False)
+    dump_records(cleaned_records, OUTPUT_PATH)
 
     print(f"Cleaned {len(cleaned_records)} records → {OUTPUT_PATH}")
 
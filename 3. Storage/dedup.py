@@ -0,0 +1,119 @@
+import hashlib
+import re
+import unicodedata
+from collections import defaultdict
+from typing import Dict, Iterable, List, Set
+
+# --------------------------------------------------
+# MINHASH / LSH CONFIG
+# --------------------------------------------------
+NUM_PERM = 64           # signature length
+BANDS = 16              # LSH bands (BANDS * ROWS must equal NUM_PERM)
+ROWS = NUM_PERM // BANDS
+SHINGLE_SIZE = 3        # word n-grams
+SIMILARITY_THRESHOLD = 0.8
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+# Fixed seeds so signatures are stable across runs
+_PERMUTATIONS = [
+    (
+        int.from_bytes(hashlib.blake2b(f"a{i}".encode(), digest_size=8).digest(), "big") % _MERSENNE_PRIME or 1,
+        int.from_bytes(hashlib.blake2b(f"b{i}".encode(), digest_size=8).digest(), "big") % _MERSENNE_PRIME,
+    )
+    for i in range(NUM_PERM)
+]
+
+# --------------------------------------------------
+# NORMALISATION
+# --------------------------------------------------
+def normalize_publication(text: str) -> str:
+    """
+    Canonical form used for matching: accent-folded, lowercased,
+    punctuation dropped and whitespace collapsed.
+    """
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    text = text.casefold()
+    text = re.sub(r"[^\w\s]", " ", text)
+    return re.sub(r"\s+", " ", text).strip()
+
+# --------------------------------------------------
+# MINHASH
+# --------------------------------------------------
+def _shingles(normalized: str) -> Set[bytes]:
+    words = normalized.split()
+    if len(words) < SHINGLE_SIZE:
+        return {" ".join(words).encode("utf-8")}
+    return {
+        " ".join(words[i:i + SHINGLE_SIZE]).encode("utf-8")
+        for i in range(len(words) - SHINGLE_SIZE + 1)
+    }
+
+
+def minhash_signature(normalized: str) -> List[int]:
+    hashed = [
+        int.from_bytes(hashlib.blake2b(s, digest_size=4).digest(), "big")
+        for s in _shingles(normalized)
+    ]
+    return [
+        min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashed)
+        for a, b in _PERMUTATIONS
+    ]
+
+
+def estimated_similarity(sig_a: List[int], sig_b: List[int]) -> float:
+    return sum(x == y for x, y in zip(sig_a, sig_b)) / NUM_PERM
+
+# --------------------------------------------------
+# CLUSTERING
+# --------------------------------------------------
+def cluster_near_duplicates(normalized_texts: Iterable[str]) -> Dict[str, str]:
+    """
+    Map every normalized text to a cluster representative.
+
+    Candidate pairs come from LSH band collisions, so only texts sharing
+    a band are compared instead of every pair. Each candidate pair is
+    confirmed against SIMILARITY_THRESHOLD and merged with union-find.
+    """
+    texts = list(dict.fromkeys(normalized_texts))
+    order = {t: i for i, t in enumerate(texts)}
+    parent = {t: t for t in texts}
+
+    def find(t: str) -> str:
+        while parent[t] != t:
+            parent[t] = parent[parent[t]]
+            t = parent[t]
+        return t
+
+    signatures = {t: minhash_signature(t) for t in texts}
+
+    buckets = defaultdict(list)
+    for t, sig in signatures.items():
+        for band in range(BANDS):
+            key = (band, tuple(sig[band * ROWS:(band + 1) * ROWS]))
+            buckets[key].append(t)
+
+    # Buckets are small, so every pair sharing one is checked directly;
+    # a pair colliding in several bands is only scored once
+    compared = set()
+    for members in buckets.values():
+        for i, a in enumerate(members):
+            for b in members[i + 1:]:
+                if (a, b) in compared:
+                    continue
+                compared.add((a, b))
+                if estimated_similarity(signatures[a], signatures[b]) < SIMILARITY_THRESHOLD:
+                    continue
+
+                root_a, root_b = find(a), find(b)
+                if root_a == root_b:
+                    continue
+                # Keep the first-seen text as the representative
+                if order[root_a] <= order[root_b]:
+                    parent[root_b] = root_a
+                else:
+                    parent[root_a] = root_b
+
+    return {t: find(t) for t in texts}
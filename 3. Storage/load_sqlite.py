@@ -1,6 +1,13 @@
 import sqlite3
 import json
 import os
+import sys
+
+from dedup import cluster_near_duplicates, normalize_publication
+
+# records.py sits at the project root and is shared by every stage
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from records import load_records
 
 # --------------------------------------------------
 # PATH CONFIG
@@ -17,11 +24,7 @@ DB_PATH = os.path.join(PROJECT_ROOT, "3. Storage", "faculty.db")
 # --------------------------------------------------
 def load_faculty_data(file_path):
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            if not isinstance(data, list):
-                raise ValueError("JSON root must be a list of faculty entries")
-            return data
+        return list(load_records(file_path))
     except FileNotFoundError:
         print(f"File not found: {file_path}")
         return []
@@ -43,6 +46,8 @@ def create_schema(conn):
         DROP TABLE IF EXISTS contact;
         DROP TABLE IF EXISTS teaching;
         DROP TABLE IF EXISTS publications;
+        DROP TABLE IF EXISTS faculty_publication;
+        DROP TABLE IF EXISTS publication;
 
         CREATE TABLE faculty (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -70,12 +75,20 @@ def create_schema(conn):
             FOREIGN KEY (faculty_id) REFERENCES faculty(id)
         );
 
-        CREATE TABLE publications (
+        CREATE TABLE publication (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
-            faculty_id INTEGER,
-            publication TEXT,
-            FOREIGN KEY (faculty_id) REFERENCES faculty(id)
+            publication TEXT NOT NULL
         );
+
+        -- clustered by publication so "who else wrote this" is a key seek;
+        -- no second index, the link table is scanned for per-faculty lookups
+        CREATE TABLE faculty_publication (
+            publication_id INTEGER NOT NULL,
+            faculty_id INTEGER NOT NULL,
+            PRIMARY KEY (publication_id, faculty_id),
+            FOREIGN KEY (faculty_id) REFERENCES faculty(id),
+            FOREIGN KEY (publication_id) REFERENCES publication(id)
+        ) WITHOUT ROWID;
         """)
         conn.commit()
     except sqlite3.Error as e:
@@ -85,8 +98,44 @@ def create_schema(conn):
 # --------------------------------------------------
 # INSERT DATA
 # --------------------------------------------------
+def insert_publications(cursor, faculty_publications):
+    """
+    Store each distinct publication once and link it to every faculty
+    member who lists it. Exact matches share a normalized form; near
+    duplicates are folded into the first-seen rendering via MinHash/LSH.
+    Deduplication happens here, so the table needs no extra key column.
+    """
+    normalized = {}
+    for _, pub in faculty_publications:
+        normalized.setdefault(pub, normalize_publication(pub))
+
+    representative = cluster_near_duplicates(
+        n for n in normalized.values() if n
+    )
+
+    publication_ids = {}
+    for faculty_id, pub in faculty_publications:
+        key = normalized[pub]
+        if not key:
+            continue
+        cluster = representative[key]
+
+        if cluster not in publication_ids:
+            cursor.execute(
+                "INSERT INTO publication (publication) VALUES (?)",
+                (pub,)
+            )
+            publication_ids[cluster] = cursor.lastrowid
+
+        cursor.execute(
+            "INSERT OR IGNORE INTO faculty_publication (publication_id, faculty_id) VALUES (?, ?)",
+            (publication_ids[cluster], faculty_id)
+        )
+
+
 def insert_faculty_data(conn, cleaned_data):
     cursor = conn.cursor()
+    faculty_publications = []
     try:
         for entry in cleaned_data:
             cursor.execute("""
@@ -100,39 +149,37 @@ def insert_faculty_data(conn, cleaned_data):
             )
             VALUES (?, ?, ?, ?, ?, ?)
             """, (
-                entry.get("name"),
-                entry.get("faculty"),          # <-- CORRECT FIELD
-                entry.get("education"),
-                entry.get("biography"),
-                entry.get("specialization"),
-                entry.get("profile_url")
+                entry.name,
+                entry.faculty_type,
+                entry.education,
+                entry.biography,
+                entry.specialization,
+                entry.profile_url
             ))
 
             faculty_id = cursor.lastrowid
 
-            contact = entry.get("contact", {})
+            contact = entry.contact
             cursor.execute("""
             INSERT INTO contact (faculty_id, phone, email, address)
             VALUES (?, ?, ?, ?)
             """, (
                 faculty_id,
-                contact.get("phone"),
-                contact.get("email"),
-                contact.get("address")
+                contact.phone,
+                contact.email,
+                contact.address
             ))
 
-            for subject in entry.get("teaching", []):
+            for subject in entry.teaching:
                 cursor.execute(
                     "INSERT INTO teaching (faculty_id, subject) VALUES (?, ?)",
                     (faculty_id, subject)
                 )
 
-            for pub in entry.get("publications", []):
-                cursor.execute(
-                    "INSERT INTO publications (faculty_id, publication) VALUES (?, ?)",
-                    (faculty_id, pub)
-                )
+            for pub in entry.publications:
+                faculty_publications.append((faculty_id, pub))
 
+        insert_publications(cursor, faculty_publications)
         conn.commit()
     except sqlite3.Error as e:
         print(f"Insert failed: {e}")
@@ -1,11 +1,39 @@
-from fastapi import FastAPI, HTTPException #for error handling 
+from fastapi import FastAPI, HTTPException, Query, Request, Response #for error handling 
 import sqlite3 #db connectt
-from typing import List, Dict #structure mention
+from typing import List, Dict, Optional, Tuple #structure mention
+from contextlib import asynccontextmanager
+import gzip
 import json
+import logging
+import os
+import sys
+import threading
 
-app = FastAPI(title="Faculty API", description="Serve faculty data")
+from suggest import PrefixIndex, faculty_entries
 
-import os
+# records.py sits at the project root and is shared by every stage
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from records import specialization_terms
+
+try:
+    import brotli #optional, enables "br" encoding
+except ImportError:
+    brotli = None
+
+
+@asynccontextmanager
+async def lifespan(app):
+    #warm the /suggest index; a missing or empty db must not stop the API,
+    #the index is then built on the first /suggest request instead
+    try:
+        get_suggest_index()
+    except Exception as e:
+        detail = getattr(e, "detail", e)
+        logging.warning(f"Suggest index not built at startup: {detail}")
+    yield
+
+
+app = FastAPI(title="Faculty API", description="Serve faculty data", lifespan=lifespan)
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DATABASE = os.path.join(BASE_DIR, "3. Storage", "faculty.db")
@@ -31,10 +59,38 @@ def get_teaching(cursor, faculty_id: int) -> List[str]:
 
 
 def get_publications(cursor, faculty_id: int) -> List[str]:
-    cursor.execute("SELECT publication FROM publications WHERE faculty_id=?", (faculty_id,))
+    cursor.execute("""SELECT p.publication FROM publication p
+        JOIN faculty_publication fp ON fp.publication_id = p.id
+        WHERE fp.faculty_id=?""", (faculty_id,))
     return [r["publication"] for r in cursor.fetchall()]
 
 
+def fetch_coauthors(faculty_id: int) -> List[Dict]:
+    try:
+        conn = get_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT id FROM faculty WHERE id=?", (faculty_id,))
+        if cursor.fetchone() is None:
+            raise HTTPException(status_code=404, detail=f"Faculty {faculty_id} not found")
+
+        # self-join on the link table: everyone else linked to the same publications;
+        # CROSS JOIN keeps "theirs" as a primary-key seek on publication_id
+        cursor.execute("""SELECT f.id, f.name, f.faculty_type, COUNT(*) AS shared_publications
+            FROM faculty_publication mine
+            CROSS JOIN faculty_publication theirs
+                ON theirs.publication_id = mine.publication_id AND theirs.faculty_id != mine.faculty_id
+            JOIN faculty f ON f.id = theirs.faculty_id
+            WHERE mine.faculty_id=?
+            GROUP BY f.id
+            ORDER BY shared_publications DESC, f.name""", (faculty_id,))
+        return [dict(r) for r in cursor.fetchall()]
+    except sqlite3.Error as e:
+        raise HTTPException(status_code=500, detail=f"Database query failed: {e}")
+    finally:
+        if 'conn' in locals():
+            conn.close()
+
+
 def fetch_all_faculty() -> List[Dict]:
     try:
         conn = get_connection()
@@ -64,12 +120,149 @@ def fetch_all_faculty() -> List[Dict]:
             conn.close()
 
 
-@app.get("/faculty", response_model=List[Dict])
-def get_faculty():
+def db_generation() -> Tuple[int, int]:
+    #the loader rewrites the db file, so its mtime/size identify a generation
+    try:
+        st = os.stat(DATABASE)
+        return (st.st_mtime_ns, st.st_size)
+    except OSError as e:
+        raise HTTPException(status_code=500, detail=f"Db connection failed: {e}")
+
+
+#compressed bodies per endpoint: key -> (generation, {encoding: bytes})
+_encoded_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, bytes]]] = {}
+_encoded_lock = threading.Lock()
+
+
+def encode_payload(body: bytes) -> Dict[str, bytes]:
+    #every coding is built so a client refusing identity can still be served;
+    #choose_encoding sends the plain body when compressing does not pay off
+    encoded = {
+        "identity": body,
+        "gzip": gzip.compress(body, compresslevel=9, mtime=0),
+    }
+    if brotli is not None:
+        encoded["br"] = brotli.compress(body, quality=11)
+    return encoded
+
+
+def choose_encoding(accept_encoding: str, available: Dict[str, bytes]) -> Optional[str]:
+    """
+    Pick an encoding for a "gzip;q=0.8, br" style header: highest q-value
+    first, then the smallest body. Returns None when nothing available is
+    acceptable (identity refused by "identity;q=0" or "*;q=0").
+    """
+    if not accept_encoding.strip():
+        return "identity"
+
+    accepted = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[token] = q
+
+    def quality(enc: str) -> float:
+        if enc in accepted:
+            return accepted[enc]
+        if "*" in accepted:
+            return accepted["*"]
+        #identity is acceptable unless explicitly refused
+        return 1.0 if enc == "identity" else 0.0
+
+    candidates = [(quality(enc), enc) for enc in available]
+    candidates = [(q, enc) for q, enc in candidates if q > 0]
+    if not candidates:
+        return None
+    return min(candidates, key=lambda c: (-c[0], len(available[c[1]])))[1]
+
+
+def negotiated_response(request: Request, key: str, build) -> Response:
+    """
+    Serve a JSON payload that is encoded once per db generation.
+    `build` returns the bytes to serve and only runs when the db changed.
+    """
+    generation = db_generation()
+    with _encoded_lock:
+        cached = _encoded_cache.get(key)
+        if cached is None or cached[0] != generation:
+            cached = (generation, encode_payload(build()))
+            _encoded_cache[key] = cached
+    encoded = cached[1]
+
+    encoding = choose_encoding(request.headers.get("accept-encoding", ""), encoded)
+    headers = {"Vary": "Accept-Encoding"}
+    if encoding is None:
+        raise HTTPException(
+            status_code=406,
+            detail="No acceptable content encoding (supported: " + ", ".join(encoded) + ")",
+            headers=headers
+        )
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+
+    #Response sets Content-Length from the body it is given
+    return Response(content=encoded[encoding], media_type="application/json", headers=headers)
+
+
+def build_faculty_payload() -> bytes:
     data = fetch_all_faculty()
     if not data:
         raise HTTPException(status_code=404, detail="No faculty data found, handle your code better!")
 
     output_path = os.path.join(BASE_DIR, "faculty_output.json") 
     with open(output_path, "w", encoding="utf-8") as f: json.dump(data, f, indent=2, ensure_ascii=False) 
-    return data
\ No newline at end of file
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+@app.get("/faculty", response_model=List[Dict])
+def get_faculty(request: Request):
+    return negotiated_response(request, "faculty", build_faculty_payload)
+
+
+@app.get("/faculty/{faculty_id}/coauthors", response_model=List[Dict])
+def get_coauthors(faculty_id: int):
+    return fetch_coauthors(faculty_id)
+
+
+#prefix index for /suggest, rebuilt when the db generation changes
+_suggest_index: Dict[str, Tuple[Tuple[int, int], PrefixIndex]] = {}
+_suggest_lock = threading.Lock()
+
+
+def build_suggest_index() -> PrefixIndex:
+    try:
+        conn = get_connection()
+        cursor = conn.cursor()
+        names = [r["name"] for r in cursor.execute("SELECT name FROM faculty")]
+        specializations = [r["specialization"] for r in cursor.execute("SELECT specialization FROM faculty")]
+        subjects = [r["subject"] for r in cursor.execute("SELECT subject FROM teaching")]
+        return PrefixIndex(faculty_entries(names, specializations, subjects, specialization_terms))
+    except sqlite3.Error as e:
+        raise HTTPException(status_code=500, detail=f"Database query failed: {e}")
+    finally:
+        if 'conn' in locals():
+            conn.close()
+
+
+def get_suggest_index() -> PrefixIndex:
+    generation = db_generation()
+    with _suggest_lock:
+        cached = _suggest_index.get("index")
+        if cached is None or cached[0] != generation:
+            cached = (generation, build_suggest_index())
+            _suggest_index["index"] = cached
+    return cached[1]
+
+
+@app.get("/suggest", response_model=List[Dict])
+def suggest(prefix: str = Query(..., min_length=1), k: int = Query(10, ge=1, le=50)):
+    return get_suggest_index().suggest(prefix, k)
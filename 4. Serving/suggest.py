@@ -0,0 +1,257 @@
+import bisect
+import heapq
+import unicodedata
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Tuple
+
+BLOCK = 32   # completions scanned directly inside a block; blocks use a sparse table
+MAX_K = 50
+
+
+def fold(text: str) -> str:
+    """Case- and accent-insensitive key: 'Élodie' and 'elodie' match."""
+    if not text.isascii():
+        text = unicodedata.normalize("NFKD", text)
+        text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    return " ".join(text.casefold().split())
+
+
+class PrefixIndex:
+    """
+    Sorted array of folded keys searched with bisect.
+
+    Each key points at a (text, kind) completion whose score is how many
+    times it occurs in the data. Completions are numbered best-first, so
+    the top-k for a prefix are the k smallest numbers in its slice of the
+    array. Those are found with range-minimum queries (a sparse table over
+    fixed-size blocks), so a query costs the same for "m" as for
+    "machine learning" however many keys share the prefix.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, str, str]]):
+        # entries: (key text, display text, kind); key text may differ from
+        # display, e.g. a surname pointing at the full name
+        scores = Counter()
+        variants = defaultdict(Counter)
+        keys = set()
+        for key, text, kind in entries:
+            folded = fold(key)
+            if not folded:
+                continue
+            # case/accent variants of the same text are one completion,
+            # shown in their most common spelling
+            completion = (folded if key == text else fold(text), kind)
+            if key == text:
+                scores[completion] += 1
+            variants[completion][text] += 1
+            keys.add((folded, completion))
+
+        # completions ordered best-first (score, then alphabetical)
+        order = sorted(variants, key=lambda c: (-scores[c], c))
+        self.ranked = [(variants[c].most_common(1)[0][0], c[1]) for c in order]
+        self.scores = [scores[c] for c in order]
+        position = {c: i for i, c in enumerate(order)}
+
+        ordered = sorted(keys)
+        self.keys = [k for k, _ in ordered]
+        self.completions = [position[c] for _, c in ordered]
+        self._build_sparse_table()
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def _build_sparse_table(self):
+        # level j, entry i: position of the best completion in blocks i .. i + 2**j - 1
+        values = self.completions
+        level = []
+        for start in range(0, len(values), BLOCK):
+            block = values[start:start + BLOCK]
+            level.append(start + block.index(min(block)))
+
+        self._table = [level]
+        width = 1
+        while 2 * width <= len(level):
+            prev = self._table[-1]
+            level = [
+                a if values[a] <= values[b] else b
+                for a, b in zip(prev, prev[width:])
+            ]
+            self._table.append(level)
+            width *= 2
+
+    def _scan(self, lo: int, hi: int) -> int:
+        segment = self.completions[lo:hi]
+        return lo + segment.index(min(segment))
+
+    def _argmin(self, lo: int, hi: int) -> int:
+        """Position of the best completion in completions[lo:hi]."""
+        first, last = lo // BLOCK, (hi - 1) // BLOCK
+        if first == last:
+            return self._scan(lo, hi)
+
+        values = self.completions
+        best = self._scan(lo, (first + 1) * BLOCK)
+        tail = self._scan(last * BLOCK, hi)
+        if values[tail] < values[best]:
+            best = tail
+
+        if first + 1 < last:
+            span = last - first - 1
+            j = span.bit_length() - 1
+            level = self._table[j]
+            for pos in (level[first + 1], level[last - (1 << j)]):
+                if values[pos] < values[best]:
+                    best = pos
+        return best
+
+    def _range(self, prefix: str) -> Tuple[int, int]:
+        lo = bisect.bisect_left(self.keys, prefix)
+        hi = bisect.bisect_left(self.keys, prefix + "\U0010ffff", lo)
+        return lo, hi
+
+    def _top(self, lo: int, hi: int, k: int) -> List[int]:
+        # pop the best of a range, then split the range around it; a
+        # completion reachable from several keys is reported once
+        values = self.completions
+        found = []
+        seen = set()
+        heap = []
+        if lo < hi:
+            pos = self._argmin(lo, hi)
+            heap.append((values[pos], pos, lo, hi))
+
+        while heap and len(found) < k:
+            value, pos, lo, hi = heapq.heappop(heap)
+            if value not in seen:
+                seen.add(value)
+                found.append(value)
+            for a, b in ((lo, pos), (pos + 1, hi)):
+                if a < b:
+                    p = self._argmin(a, b)
+                    heapq.heappush(heap, (values[p], p, a, b))
+        return found
+
+    def suggest(self, prefix: str, k: int = 10) -> List[Dict]:
+        folded = fold(prefix)
+        if not folded:
+            return []
+
+        k = max(1, min(k, MAX_K))
+        return [
+            {"text": self.ranked[i][0], "type": self.ranked[i][1], "score": self.scores[i]}
+            for i in self._top(*self._range(folded), k)
+        ]
+
+
+def faculty_entries(names: Iterable[str], specializations: Iterable[str],
+                    subjects: Iterable[str], split_terms) -> Iterable[Tuple[str, str, str]]:
+    """
+    Index entries from database columns. Names are also reachable by any
+    later word (surname), specializations go through `split_terms`.
+    """
+    for name in names:
+        if not name:
+            continue
+        words = name.split()
+        for i in range(len(words)):
+            yield " ".join(words[i:]), name, "name"
+
+    for spec in specializations:
+        for term in split_terms(spec):
+            yield term, term, "specialization"
+
+    for subject in subjects:
+        if subject:
+            yield subject, subject, "teaching"
+
+# --------------------------------------------------
+# BENCHMARK
+# --------------------------------------------------
+def _random_vocabulary(rng, size: int) -> List[Tuple[str, str, str]]:
+    alphabet = "abcdefghijklmnopqrstuvwxyzéü"
+
+    def word() -> str:
+        return "".join(rng.choice(alphabet) for _ in range(rng.randint(3, 10)))
+
+    entries = []
+    for _ in range(size):
+        text = " ".join(word() for _ in range(rng.randint(1, 3))).title()
+        entries.append((text, text, rng.choice(("name", "specialization", "teaching"))))
+    return entries
+
+
+def _skewed_vocabulary(rng, size: int) -> List[Tuple[str, str, str]]:
+    # Zipf-like: a few heads ("Machine Learning ...") cover most terms,
+    # so common prefixes match a large share of the index
+    heads = [
+        "Machine Learning", "Machine Vision", "Data Science", "Data Mining",
+        "Computer Vision", "Computer Networks", "Signal Processing",
+        "Wireless Communication", "Natural Language Processing", "Algorithms",
+        "Distributed Systems", "Information Retrieval", "Cryptography",
+        "Quantum Computing", "Embedded Systems", "Software Engineering",
+    ]
+    weights = [1 / (rank + 1) ** 1.2 for rank in range(len(heads))]
+    qualifiers = ["for", "in", "and", "with", "applied to", "based"]
+    topics = [
+        "Healthcare", "Agriculture", "Finance", "Robotics", "Education",
+        "Remote Sensing", "Speech", "Graphs", "Networks", "Security",
+        "Video", "Text", "Genomics", "Climate", "Energy", "Transport",
+    ]
+
+    entries = []
+    for n in range(size):
+        head = rng.choices(heads, weights)[0]
+        text = f"{head} {rng.choice(qualifiers)} {rng.choice(topics)} {n}"
+        kind = rng.choice(("specialization", "teaching"))
+        # repeat some terms so scores differ
+        for _ in range(int(rng.paretovariate(2))):
+            entries.append((text, text, kind))
+    return entries
+
+
+def benchmark(vocab_size: int = 200_000, queries: int = 20_000) -> Dict[str, Dict[str, float]]:
+    import random
+    import time
+
+    rng = random.Random(42)
+    results = {}
+    for label, make in (("random", _random_vocabulary), ("skewed", _skewed_vocabulary)):
+        entries = make(rng, vocab_size)
+
+        start = time.perf_counter()
+        index = PrefixIndex(entries)
+        build_s = time.perf_counter() - start
+
+        prefixes = ["m", "ma", "mac", "machine", "machine learning", "data", "comp"]
+        for _ in range(queries):
+            key = fold(rng.choice(entries)[0])
+            prefixes.append(key[:rng.randint(1, min(len(key), 12))])
+
+        timings = []
+        for prefix in prefixes:
+            start = time.perf_counter()
+            index.suggest(prefix, 10)
+            timings.append(time.perf_counter() - start)
+        timings.sort()
+
+        results[label] = {
+            "keys": len(index),
+            "build_s": build_s,
+            "avg_query_us": sum(timings) / len(timings) * 1e6,
+            "p99_query_us": timings[int(len(timings) * 0.99)] * 1e6,
+            "max_query_us": timings[-1] * 1e6,
+        }
+    return results
+
+
+if __name__ == "__main__":
+    import sys
+
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    for label, stats in benchmark(size).items():
+        print(f"[{label}]")
+        print(f"  keys indexed : {stats['keys']:,}")
+        print(f"  build time   : {stats['build_s']:.2f} s")
+        print(f"  avg query    : {stats['avg_query_us']:.1f} µs")
+        print(f"  p99 query    : {stats['p99_query_us']:.1f} µs")
+        print(f"  max query    : {stats['max_query_us']:.1f} µs")
@@ -1,7 +1,11 @@
 import json
 import os
+import sys
 from collections import Counter, defaultdict
-import re
+
+# records.py sits at the project root and is shared by every stage
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from records import specialization_terms
 
 # --------------------------------------------------
 # PATH CONFIG
@@ -71,23 +75,6 @@ avg_bio_length = (
 # --------------------------------------------------
 # 4. SPECIALIZATION DISTRIBUTION (NO GUESSING)
 # --------------------------------------------------
-def is_valid_specialization(token: str) -> bool:
-    token = token.strip()
-
-    if not token:
-        return False
-    if len(token) > 120:
-        return False
-
-    lower = token.lower()
-    if lower.startswith(("meet ", "please click", "know more")):
-        return False
-    if re.search(r"\b(received|currently|serving|experience|worked)\b", lower):
-        return False
-
-    return True
-
-
 specialization_distribution = Counter()
 
 for record in data:
@@ -97,16 +84,11 @@ for record in data:
         specialization_distribution[NA] += 1
         continue
 
-    parts = [s.strip() for s in spec.split(",")]
-    valid_found = False
-
-    for part in parts:
-        cleaned = re.sub(r"[.\s]+$", "", part)
-        if is_valid_specialization(cleaned):
-            specialization_distribution[cleaned] += 1
-            valid_found = True
+    terms = specialization_terms(spec)
+    for term in terms:
+        specialization_distribution[term] += 1
 
-    if not valid_found:
+    if not terms:
         specialization_distribution[NA] += 1
 
 # --------------------------------------------------
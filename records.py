@@ -0,0 +1,289 @@
+import json
+import re
+import sys
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# -------------------------------------------------------------------
+# Shared record model used by every pipeline stage.
+#
+# Records are __slots__ classes instead of dicts, and fields that repeat
+# across many records (faculty type, address, "Not Available", ...) are
+# interned so every record points at the same string object.
+# -------------------------------------------------------------------
+NA_STRING = sys.intern("Not Available")
+
+RAW_FIELDS = (
+    "name", "faculty_type", "education", "phone", "email", "address",
+    "specialization", "profile_url", "biography", "publications",
+    "teaching", "source_listing_url", "scraped_at"
+)
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _intern_na(value: Any) -> Any:
+    # mostly-unique text: only share the "Not Available" placeholder
+    return NA_STRING if value == NA_STRING else value
+
+
+def _tuple(values: Any) -> Tuple[str, ...]:
+    return tuple(values) if isinstance(values, (list, tuple)) else ()
+
+# -------------------------------------------------------------------
+# Ingestion output
+# -------------------------------------------------------------------
+class RawRecord:
+    """Profile as scraped, before cleaning. Missing values are kept as-is."""
+
+    __slots__ = RAW_FIELDS
+
+    def __init__(self, **fields: Any):
+        for field in RAW_FIELDS:
+            setattr(self, field, fields.get(field))
+
+        self.faculty_type = _intern(self.faculty_type)
+        self.address = _intern(self.address)
+        self.source_listing_url = _intern(self.source_listing_url)
+        self.publications = _tuple(self.publications)
+        self.teaching = _tuple(self.teaching)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RawRecord":
+        return cls(**{k: data.get(k) for k in RAW_FIELDS})
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {field: getattr(self, field) for field in RAW_FIELDS}
+        data["publications"] = list(self.publications)
+        data["teaching"] = list(self.teaching)
+        return data
+
+    @staticmethod
+    def is_valid(data: Dict[str, Any]) -> bool:
+        return all(key in data for key in RAW_FIELDS)
+
+# -------------------------------------------------------------------
+# Transformation / storage / serving
+# -------------------------------------------------------------------
+class Contact:
+    __slots__ = ("phone", "email", "address")
+
+    def __init__(self, phone: str = NA_STRING, email: str = NA_STRING, address: str = NA_STRING):
+        self.phone = _intern_na(phone)
+        self.email = _intern_na(email)
+        self.address = _intern(address)
+
+    def to_dict(self) -> Dict[str, str]:
+        return {"phone": self.phone, "email": self.email, "address": self.address}
+
+
+class FacultyRecord:
+    """Cleaned faculty record, as written by the cleaner and read by the loader."""
+
+    __slots__ = (
+        "name", "faculty_type", "education", "biography", "specialization",
+        "teaching", "publications", "contact", "profile_url"
+    )
+
+    def __init__(
+        self,
+        name: str = NA_STRING,
+        faculty_type: str = NA_STRING,
+        education: str = NA_STRING,
+        biography: str = NA_STRING,
+        specialization: str = NA_STRING,
+        teaching: Iterable[str] = (),
+        publications: Iterable[str] = (),
+        contact: Optional[Contact] = None,
+        profile_url: str = NA_STRING
+    ):
+        self.name = name
+        self.faculty_type = _intern(faculty_type)
+        self.education = _intern_na(education)
+        self.biography = _intern_na(biography)
+        self.specialization = _intern_na(specialization)
+        self.teaching = tuple(_intern(t) for t in teaching)
+        self.publications = tuple(publications)
+        self.contact = contact if contact is not None else Contact()
+        self.profile_url = profile_url
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FacultyRecord":
+        contact = data.get("contact") or {}
+        return cls(
+            name=data.get("name", NA_STRING),
+            # older cleaned files used "faculty" for the type
+            faculty_type=data.get("faculty_type", data.get("faculty", NA_STRING)),
+            education=data.get("education", NA_STRING),
+            biography=data.get("biography", NA_STRING),
+            specialization=data.get("specialization", NA_STRING),
+            teaching=_tuple(data.get("teaching")),
+            publications=_tuple(data.get("publications")),
+            contact=Contact(
+                contact.get("phone", NA_STRING),
+                contact.get("email", NA_STRING),
+                contact.get("address", NA_STRING)
+            ),
+            profile_url=data.get("profile_url", NA_STRING)
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "faculty_type": self.faculty_type,
+            "education": self.education,
+            "biography": self.biography,
+            "specialization": self.specialization,
+            "teaching": list(self.teaching),
+            "publications": list(self.publications),
+            "contact": self.contact.to_dict(),
+            "profile_url": self.profile_url
+        }
+
+# -------------------------------------------------------------------
+# Specialization terms
+# -------------------------------------------------------------------
+def is_valid_specialization(token: str) -> bool:
+    token = token.strip()
+
+    if not token:
+        return False
+    if len(token) > 120:
+        return False
+
+    lower = token.lower()
+    if lower.startswith(("meet ", "please click", "know more")):
+        return False
+    if re.search(r"\b(received|currently|serving|experience|worked)\b", lower):
+        return False
+
+    return True
+
+
+def specialization_terms(spec: Optional[str]) -> List[str]:
+    """Comma-separated specialization text -> valid terms (no guessing)."""
+    if spec in (None, "", NA_STRING):
+        return []
+
+    terms = []
+    for part in spec.split(","):
+        cleaned = re.sub(r"[.\s]+$", "", part.strip())
+        if is_valid_specialization(cleaned):
+            terms.append(cleaned)
+    return terms
+
+# -------------------------------------------------------------------
+# (De)serialisation
+# -------------------------------------------------------------------
+def dump_json(records: Iterable, path: str):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump([r.to_dict() for r in records], f, indent=2, ensure_ascii=False)
+
+
+def _from_items(items: Iterable[Any], cls) -> Iterator:
+    # skip only a broken entry (null, a bare string, ...), never the whole file
+    for item in items:
+        if isinstance(item, dict):
+            yield cls.from_dict(item)
+
+
+def load_json(path: str, cls=FacultyRecord) -> List:
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, list):
+        raise ValueError("JSON root must be a list of faculty entries")
+    return list(_from_items(data, cls))
+
+
+def dump_ndjson(records: Iterable, path: str):
+    """One compact JSON object per line, written as the records arrive."""
+    encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+    with open(path, "w", encoding="utf-8") as f:
+        for r in records:
+            f.write(encoder.encode(r.to_dict()))
+            f.write("\n")
+
+
+def iter_ndjson(path: str, cls=FacultyRecord) -> Iterator:
+    """Stream records one line at a time without loading the whole file."""
+    decoder = json.JSONDecoder()
+
+    def items():
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield decoder.decode(line)
+                except json.JSONDecodeError:
+                    continue
+
+    return _from_items(items(), cls)
+
+
+def dump_records(records: Iterable, path: str):
+    """Write NDJSON for a .ndjson path, a JSON list otherwise."""
+    if path.endswith(".ndjson"):
+        dump_ndjson(records, path)
+    else:
+        dump_json(records, path)
+
+
+def load_records(path: str, cls=FacultyRecord) -> Iterable:
+    """Stream a .ndjson file, load any other path as a JSON list."""
+    if path.endswith(".ndjson"):
+        return iter_ndjson(path, cls)
+    return load_json(path, cls)
+
+# -------------------------------------------------------------------
+# Memory benchmark: dict records vs FacultyRecord
+# -------------------------------------------------------------------
+def _synthetic_lines(n: int) -> Iterator[str]:
+    types = ["core", "adjunct", "international", "distinguished", "practice"]
+    subjects = ["Machine Learning", "Digital Communication", "Algorithms", "Operating Systems"]
+    for i in range(n):
+        yield json.dumps({
+            "name": f"Faculty {i}",
+            "faculty_type": types[i % len(types)],
+            "education": "PhD (Computer Science), IIT Bombay" if i % 3 else NA_STRING,
+            "biography": NA_STRING if i % 4 else f"Works on topic {i % 500}.",
+            "specialization": subjects[i % len(subjects)],
+            "teaching": subjects[: 1 + i % len(subjects)],
+            "publications": [f"Paper {i}"] if i % 2 else [],
+            "contact": {
+                "phone": NA_STRING,
+                "email": f"faculty_{i}@daiict.ac.in",
+                "address": "DA-IICT, Gandhinagar" if i % 2 else NA_STRING
+            },
+            "profile_url": f"https://www.daiict.ac.in/faculty/{i}"
+        })
+
+
+def benchmark_memory(n: int = 1_000_000) -> Dict[str, float]:
+    import gc
+    import tracemalloc
+
+    results = {}
+    for label, build in (
+        ("dict", json.loads),
+        ("FacultyRecord", lambda line: FacultyRecord.from_dict(json.loads(line))),
+    ):
+        gc.collect()
+        tracemalloc.start()
+        records = [build(line) for line in _synthetic_lines(n)]
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results[label] = current / n
+        del records
+
+    return results
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    stats = benchmark_memory(count)
+    for label, per_record in stats.items():
+        print(f"{label:>14}: {per_record:8.1f} bytes/record ({per_record * count / 2**20:8.1f} MiB for {count:,})")
+    print(f"{'saving':>14}: {1 - stats['FacultyRecord'] / stats['dict']:.1%}")